@@ -1 +1,2 @@
-from .craftyweb import *
\ No newline at end of file
+from .craftyweb import *
+from .asynccraftyweb import *
\ No newline at end of file
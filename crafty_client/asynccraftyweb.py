@@ -0,0 +1,763 @@
+import asyncio
+import functools
+import logging
+
+from crafty_client.craftyweb import _CraftyWebBase
+from crafty_client.static.exceptions import *
+from crafty_client.static.json_utils import dumps, loads
+from crafty_client.static.routes import (BASE_URL, INVALIDATE_TOKENS_URL, ROLES_URL, ROLE_SERVERS_URL, ROLE_URL,
+    ROLE_USERS_URL, SCHEMA_NAME_URL, SCHEMA_URL, SERVERS_URL, SERVER_PUBLIC_URL, SERVER_STATS_URL, SERVER_STDIN_URL,
+    SERVER_TASKS_URL, SERVER_TASK_URL, SERVER_URL, SERVER_USERS_URL, USERS_URL, USER_PERMISSIONS_URL, USER_PFP_URL,
+    USER_PUBLIC_URL, USER_URL)
+
+__all__ = ['AsyncCraftyWeb', 'AccessDenied', 'IncorrectCredentials', 'MissingParameters', 'NotAllowed',
+           'ServerAlreadyRunning', 'ServerNotFound', 'ServerNotRunning']
+
+_log = logging.getLogger(__name__)
+
+
+def _user_getter(route):
+    """
+    Coroutine counterpart of `craftyweb._user_getter`, generates the getter for the per-user `route` template.
+    """
+
+    def decorator(stub):
+        @functools.wraps(stub)
+        async def getter(self, user_id):
+            self._ensure_id(user_id, 'user_id')
+            return await self._make_request('GET', route % user_id, unwrap='data')
+
+        return getter
+
+    return decorator
+
+
+class AsyncCraftyWeb(_CraftyWebBase):
+    __slots__ = ('url', '_base_url', 'token', 'verify_ssl', 'headers', 'debug', 'server_response', 'validate_roles',
+                 'connection_limit', '_timeout', '_max_retries', '_session')
+
+    def __init__(self, url, api_token, verify_ssl=False, server_response=True, debug=False, connection_limit=32,
+                 validate_roles=False, max_retries=3, timeout=None):
+        """
+        The asyncio counterpart of `CraftyWeb`, built on aiohttp (pip install crafty_client[async]).
+
+        Every API method is a coroutine, so calls for many servers/users can be overlapped with `asyncio.gather` or the
+        `*_bulk`/`get_users_*` batch methods. At most `connection_limit` requests are in flight at once, lower it to go
+        easier on the server.
+        `timeout` and `max_retries` behave like they do for `CraftyWeb`: the timeout (in seconds) applies to every
+        request and None waits indefinitely, failed connection attempts are retried for every request and read errors
+        or 502/503/504 responses only for GET/HEAD requests. A GET/HEAD request still answered with 502/503/504 once the
+        retries run out raises `aiohttp.ClientResponseError`, where `CraftyWeb` raises `requests.exceptions.RetryError`.
+        The underlying `aiohttp.ClientSession` is created on first use and must be released with `close()` or by
+        using the client as an async context manager.
+        """
+        self.url = url
+        # Routes all start with a '/', strip it from the base once so the endpoint is a plain concatenation
+        self._base_url = url.rstrip('/')
+        self.token = api_token
+        self.verify_ssl = verify_ssl
+        self.headers = {'Authorization': f'Bearer {self.token}', 'Content-Type': 'application/json'}
+        self.debug = debug
+        self.server_response = server_response
+        self.validate_roles = validate_roles
+        self.connection_limit = connection_limit
+        self._timeout = timeout
+        self._max_retries = max_retries
+
+        self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def _fetch_bulk(self, getter, ids):
+        # Concurrency is capped by the connector's connection_limit, excess requests wait for a free connection
+        return list(await asyncio.gather(*[getter(item_id) for item_id in ids]))
+
+    def _get_session(self):
+        if self._session is None or self._session.closed:
+            import aiohttp
+
+            connector = aiohttp.TCPConnector(ssl=self.verify_ssl, limit=self.connection_limit)
+            # aiohttp gives up after 5 minutes by default, an explicit total of None waits indefinitely like requests
+            timeout = aiohttp.ClientTimeout(total=self._timeout)
+            self._session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+        return self._session
+
+    async def _make_request(self, method, api_route, params=None, data=None, not_json=None, headers=None, unwrap=None,
+                            log_response=True):
+        endpoint = self._base_url + api_route
+
+        body = dumps(data) if data is not None else not_json
+        headers = self.headers if headers is None else headers
+
+        content, route = await self._send(method, endpoint, headers, params, body)
+        # Decoding the whole body is only worth it when the debug output is actually going to be emitted
+        if self.debug and _log.isEnabledFor(logging.DEBUG):
+            _log.debug('Debug: \n%s', content.decode(route.get_encoding()))
+        response_dict = loads(content)
+        if log_response and self.server_response:
+            _log.info('%s', response_dict)
+
+        # Callers index these keys directly, but error responses carry no 'data' and other keys may be left out
+        for key in ('status', 'data', 'error'):
+            response_dict.setdefault(key, None)
+        if not response_dict.get('info'):
+            response_dict['info'] = response_dict.get('error_data')
+
+        if response_dict.get('error'):
+            self._check_errors(response_dict)
+        return response_dict.get(unwrap) if unwrap else response_dict
+
+    async def _send(self, method, endpoint, headers, params, body):
+        # Same policy as the urllib3 Retry mounted by CraftyWeb: a request that never reached the server is always
+        # retried, read errors and 502/503/504 responses only for GET/HEAD since the server may have applied the rest.
+        # Running out of retries on one of those statuses raises instead of handing the error page to the JSON parser.
+        import aiohttp
+
+        idempotent = method in self._RETRY_METHODS
+        attempt = 0
+        while True:
+            try:
+                async with self._get_session().request(method, endpoint, headers=headers, params=params,
+                                                       data=body) as route:
+                    if not (idempotent and route.status in self._RETRY_STATUSES):
+                        return await route.read(), route
+                    if attempt >= self._max_retries:
+                        route.raise_for_status()
+            except aiohttp.ClientConnectorError:
+                if attempt >= self._max_retries:
+                    raise
+            except (aiohttp.ServerDisconnectedError, aiohttp.ClientPayloadError, asyncio.TimeoutError):
+                if not idempotent or attempt >= self._max_retries:
+                    raise
+            await asyncio.sleep(self._RETRY_BACKOFF * 2 ** attempt)
+            attempt += 1
+
+    async def warmup(self):
+        """
+        Async version of `CraftyWeb.warmup`, opens a connection to the server ahead of the first API call.
+
+        :return: True if the server could be reached, otherwise False.
+        :rtype: bool
+        """
+
+        import aiohttp
+
+        try:
+            async with self._get_session().head(self._base_url + BASE_URL, headers=self.headers):
+                pass
+        except (aiohttp.ClientError, OSError) as e:
+            _log.debug('Connection warmup failed: %s', e)
+            return False
+        return True
+
+    async def close(self):
+        """
+        Closes the underlying aiohttp session and all of its connections.
+        """
+
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def get_token(self, username, password=None, password_path=None):
+        """
+        Async version of `CraftyWeb.get_token`.
+
+        :param username: The username for the user to log in.
+        :type username: str
+        :param password: The password for the user. Either `password` or `password_path` must be specified.
+        :type password: str, optional
+        :param password_path: The path to a file containing the user's password.
+        :type password_path: str, optional
+        :return: The token generated by the Crafty Controller upon successful login.
+        :rtype: str
+        :raises ValueError: If neither `password` nor `password_path` are specified.
+        :raises IncorrectCredentials: If the username or password are incorrect.
+        """
+
+        request = self._prepare_login(username, password, password_path)
+        # Login must not carry the current bearer token, so the default headers aren't used for this request
+        token = self._token_from_login(await self._make_request(*request, headers={'Content-Type': 'application/json'}))
+
+        self.token = token
+        self.headers['Authorization'] = f'Bearer {token}'
+        return token
+
+    async def log_out(self):
+        """
+        Async version of `CraftyWeb.log_out`.
+
+        :return: A dictionary containing the response from the server.
+        :rtype: dict
+        """
+
+        return self._check_log_out(await self._make_request('POST', INVALIDATE_TOKENS_URL))
+
+    # Role Functions
+
+    async def get_all_roles(self):
+        """
+        Async version of `CraftyWeb.get_all_roles`.
+
+        :return: A list containing dictionaries, with each dictionary representing a role.
+        :rtype: list[dict]
+        """
+
+        return await self._make_request('GET', ROLES_URL, unwrap='data')
+
+    async def create_role(self, name, server_ids, permissions, manager):
+        """
+        Async version of `CraftyWeb.create_role`.
+
+        :param name: The name of the new role.
+        :type name: str
+        :param server_ids: A list of server IDs that the role will apply to.
+        :type server_ids: list[int] | int
+        :param permissions: A string of eight binary digits representing the role's permissions.
+        :type permissions: str | int
+        :param manager: The manager of the new role.
+        :type: int | str
+        :return: A dictionary containing the response from the server.
+        :rtype: dict
+        """
+        return await self._make_request(*self._prepare_create_role(name, server_ids, permissions, manager))
+
+    async def get_role(self, role_id):
+        """
+        Async version of `CraftyWeb.get_role`.
+
+        :param role_id: The ID of the role to retrieve.
+        :type role_id: int | str
+        :return: A dictionary containing information about the role.
+        :rtype: dict
+        """
+
+        self._ensure_id(role_id, 'role_id')
+
+        url = ROLE_URL % role_id
+        return await self._make_request('GET', url, unwrap='data')
+
+    async def get_roles_servers(self, role_id):
+        """
+        Async version of `CraftyWeb.get_roles_servers`.
+
+        :param role_id: The ID of the role to retrieve servers for.
+        :type role_id: int | str
+        :return: A list containing dictionaries, where each dictionary represents a server that the role has access to
+            along with its respective permissions.
+        :rtype: list[dict]
+        """
+
+        self._ensure_id(role_id, 'role_id')
+
+        url = ROLE_SERVERS_URL % role_id
+        return await self._make_request('GET', url, unwrap='data')
+
+    async def get_role_users(self, role_id):
+        """
+        Async version of `CraftyWeb.get_role_users`.
+
+        :param role_id: The ID of the role to retrieve users for.
+        :type role_id: int | str
+        :return: A list of user IDs that have access to the role
+        :rtype: list[int]
+        """
+
+        self._ensure_id(role_id, 'role_id')
+
+        url = ROLE_USERS_URL % role_id
+        return await self._make_request('GET', url, unwrap='data')
+
+    async def get_roles_bulk(self, role_ids):
+        """
+        Async version of `CraftyWeb.get_roles_bulk`, the roles are fetched concurrently.
+
+        :param role_ids: The IDs of the roles to retrieve.
+        :type role_ids: list[int | str]
+        :return: A list of dictionaries containing information about each role, in the same order as `role_ids`.
+        :rtype: list[dict]
+        """
+
+        return await self._fetch_bulk(self.get_role, role_ids)
+
+    async def delete_role(self, role_id):
+        """
+        Async version of `CraftyWeb.delete_role`.
+
+        :param role_id: The ID of the role to be deleted.
+        :type role_id: int | str
+        :return: A dictionary containing the response from the server.
+        :rtype: dict
+        :raises AccessDenied: If the user does not have permission to delete roles. (Superuser required)
+        """
+
+        self._ensure_id(role_id, 'role_id')
+
+        url = ROLE_URL % role_id
+        response = await self._make_request('DELETE', url)
+        if response['status'] == 'ok':
+            _log.info('Successfully Removed Role with role ID: %s', role_id)
+        return response
+
+    async def modify_role(self, role_id, name=None, server_ids=None, permissions=None):
+        """
+        Async version of `CraftyWeb.modify_role`.
+
+        :param role_id: The ID of the role to modify.
+        :type role_id: int | str
+        :param name: The new name for the role, default is None.
+        :type name: str, optional
+        :param server_ids: A list of server IDs to modify role permissions for, default is None.
+        :type server_ids: list[int] | int, optional
+        :param permissions: A binary string or list of binary strings that represent the role's permissions.
+        :type permissions: list[str] | str, optional
+        :return: A dictionary containing the response from the server.
+        :rtype: dict
+        :raises ValueError: If either server_ids or permissions is None while the other is not.
+        :raises ValueError: If server_ids and permissions do not have the same length if they are both lists
+        :raises AccessDenied: If the user does not have the necessary permissions to modify the role.
+        """
+
+        return await self._make_request(*self._prepare_modify_role(role_id, name, server_ids, permissions))
+
+    # Server Functions
+
+    async def get_all_servers(self):
+        """
+        Async version of `CraftyWeb.get_all_servers`.
+
+        :return: A list of dictionaries, where each dictionary represents a server and its properties.
+        :rtype: list[dict]
+        :raises AccessDenied: If the user does not have the necessary permissions to retrieve server information.
+        """
+
+        return await self._make_request('GET', SERVERS_URL, unwrap='data')
+
+    async def get_server(self, server_id):
+        """
+        Async version of `CraftyWeb.get_server`.
+
+        :param server_id: The ID of the server to retrieve information for.
+        :type server_id: int | str
+        :return: A dictionary containing information about the server.
+        :rtype: dict
+        :raises AccessDenied: If the user does not have permission to access the specified server.
+        """
+
+        self._ensure_id(server_id, 'server_id')
+
+        url = SERVER_URL % server_id
+        return await self._make_request('GET', url, unwrap='data')
+
+    async def get_servers_bulk(self, server_ids):
+        """
+        Async version of `CraftyWeb.get_servers_bulk`, the servers are fetched concurrently.
+
+        :param server_ids: The IDs of the servers to retrieve information for.
+        :type server_ids: list[int | str]
+        :return: A list of dictionaries containing information about each server, in the same order as `server_ids`.
+        :rtype: list[dict]
+        """
+
+        return await self._fetch_bulk(self.get_server, server_ids)
+
+    async def delete_server(self, server_id):
+        """
+        Async version of `CraftyWeb.delete_server`.
+
+        :param server_id: The ID of the server to be deleted.
+        :type server_id: int | str
+        :return: A dictionary containing the response from the server.
+        :rtype: dict
+        :raises ServerNotFound: If the server with the specified ID does not exist.
+        :raises AccessDenied: If the user does not have the necessary permissions to delete the server.
+        """
+
+        self._ensure_id(server_id, 'server_id')
+
+        url = SERVER_URL % server_id
+        response = await self._make_request('DELETE', url)
+        if response['status'] == 'ok':
+            _log.info('Successfully Removed Server with server ID: %s', server_id)
+        return response
+
+    async def modify_server(self, server_id, server_name=None, path=None, backup_path=None, executable=None,
+                            log_path=None, execution_command=None, java_selection=None, auto_start=None,
+                            auto_start_delay=None, crash_detection=None, stop_command=None,
+                            executable_update_url=None, server_ip=None, server_port=None, logs_delete_after=None,
+                            ignored_exits=None, show_status=None, shutdown_timeout=None):
+        """
+        Async version of `CraftyWeb.modify_server`, see it for the meaning of each parameter.
+
+        :return: A dictionary containing the response from the server.
+        :rtype: dict
+        :raises AccessDenied: If the user does not have the necessary permissions to modify the server.
+        """
+
+        values = (server_name, path, backup_path, executable, log_path, execution_command, java_selection, auto_start,
+                  auto_start_delay, crash_detection, stop_command, executable_update_url, server_ip, server_port,
+                  logs_delete_after, ignored_exits, show_status, shutdown_timeout)
+        return await self._make_request(*self._prepare_modify_server(server_id, values))
+
+    async def send_server_action(self, server_id, action):
+        """
+        Async version of `CraftyWeb.send_server_action`.
+
+        :param server_id: The ID of the server to send the action to.
+        :type server_id: int | str
+        :param action: The action to send to the server. Valid actions are: clone_server, start_server, stop_server,
+        restart_server, kill_server, backup_server, update_executable.
+        :type action: str
+        :return: A dictionary containing the response from the server.
+        :rtype: dict
+        :raises ValueError: If the action is not a valid action.
+        """
+
+        return await self._make_request(*self._prepare_server_action(server_id, action))
+
+    async def send_console_command(self, server_id, command):
+        """
+        Async version of `CraftyWeb.send_console_command`.
+
+        :param server_id: The ID of the server to send the command to.
+        :type server_id: int | str
+        :param command: The command data to send to the server.
+        :type command: str
+        :return: A dictionary containing the response from the server.
+        :rtype: dict
+        :raises TypeError: If the given server ID is not of type int or str.
+        """
+
+        self._ensure_id(server_id, 'server_id')
+
+        url = SERVER_STDIN_URL % server_id
+        return await self._make_request('POST', url, not_json=command)
+
+    async def get_server_logs(self, server_id, file=False, colors=False, raw=False, html=False):
+        """
+        Async version of `CraftyWeb.get_server_logs`.
+
+        :param server_id: The ID of the server to retrieve logs for.
+        :type server_id: int | str
+        :param file: If True, the logs will be read from the log file instead of stdout, default is False.
+        :type file: bool, optional
+        :param colors: If True, HTML coloring will be added to the log output, default is False.
+        :type colors: bool, optional
+        :param raw: If True, ANSI stripping will be disabled, default is False.
+        :type raw: bool, optional
+        :param html: If True, HTML formatted logs will be returned, default is False.
+        :type html: bool, optional
+        :return: A dictionary containing the server logs.
+        :rtype: dict
+        :raises AccessDenied: If the user does not have permission to access server logs.
+        """
+
+        request = self._prepare_server_logs(server_id, file, colors, raw, html)
+        return await self._make_request(*request, unwrap='data')
+
+    async def get_server_public_data(self, server_id):
+        """
+        Async version of `CraftyWeb.get_server_public_data`.
+
+        :param server_id: The ID of the server to retrieve public data for.
+        :type server_id: int | str
+        :return: A dictionary containing the public data for the server.
+        :rtype: dict
+        """
+
+        self._ensure_id(server_id, 'server_id')
+
+        url = SERVER_PUBLIC_URL % server_id
+        return await self._make_request('GET', url, unwrap='data')
+
+    async def get_server_stats(self, server_id):
+        """
+        Async version of `CraftyWeb.get_server_stats`.
+
+        :param server_id: The ID of the server to retrieve statistics for.
+        :type server_id: int | str
+        :return: A dictionary containing the statistics for the server.
+        :rtype: dict
+        """
+
+        self._ensure_id(server_id, 'server_id')
+
+        url = SERVER_STATS_URL % server_id
+        return await self._make_request('GET', url, unwrap='data')
+
+    async def get_server_users(self, server_id):
+        """
+        Async version of `CraftyWeb.get_server_users`. The users are looked up concurrently.
+
+        :param server_id: The ID of the server to retrieve users for.
+        :type server_id: int | str
+        :return: A dictionary mapping user IDs to usernames.
+        :rtype: dict
+        """
+
+        self._ensure_id(server_id, 'server_id')
+
+        url = SERVER_USERS_URL % server_id
+        users = await self._make_request('GET', url, unwrap='data')
+
+        users_data = await asyncio.gather(*[self._make_request('GET', USER_URL % user_id, unwrap='data',
+                                                               log_response=False) for user_id in users])
+        return self._usernames(users_data)
+
+    async def create_schedule(self, server_id, data):
+        """
+        Async version of `CraftyWeb.create_schedule`.
+
+        :param server_id: The ID of the server to create the task for.
+        :type server_id: int | str
+        :param data: A dictionary containing the data for the scheduled task.
+        :type data: dict
+        :return: A dictionary containing the response from the API.
+        :rtype: dict
+        :raises AccessDenied: If the user does not have permission to create a scheduled task for the server.
+        """
+
+        self._ensure_id(server_id, 'server_id')
+
+        url = SERVER_TASKS_URL % server_id
+        return await self._make_request('POST', url, data=data)
+
+    async def modify_schedule(self, server_id, task_id, data):
+        """
+        Async version of `CraftyWeb.modify_schedule`.
+
+        :param server_id: The ID of the server for which the task schedule needs to be modified.
+        :type server_id: int | str
+        :param task_id: The ID of the task schedule to be modified.
+        :type task_id: int | str
+        :param data: The data to update the task schedule with.
+        :type data: dict
+        :return: A dictionary containing the updated task schedule.
+        :rtype: dict
+        :raises AccessDenied: If the user does not have permission to modify the task schedule.
+        """
+
+        self._ensure_id(server_id, 'server_id')
+        self._ensure_id(task_id, 'task_id')
+
+        url = SERVER_TASK_URL % (server_id, task_id)
+        return await self._make_request('PATCH', url, data=data)
+
+    async def remove_schedule(self, server_id, task_id):
+        """
+        Async version of `CraftyWeb.remove_schedule`.
+
+        :param server_id: The ID of the server to remove the scheduled task from.
+        :type server_id: int | str
+        :param task_id: The ID of the scheduled task to remove.
+        :type task_id: int | str
+        :return: A dictionary containing the response from the server.
+        :rtype: dict
+        """
+
+        self._ensure_id(server_id, 'server_id')
+        self._ensure_id(task_id, 'task_id')
+
+        url = SERVER_TASK_URL % (server_id, task_id)
+        response = await self._make_request('DELETE', url)
+        if response['status'] == 'ok':
+            _log.info('Successfully Removed Schedule with task ID: %s', task_id)
+        return response
+
+    # User Functions
+
+    async def get_all_users(self):
+        """
+        Async version of `CraftyWeb.get_all_users`.
+
+        :return: A list of dictionaries, each containing information about a user.
+        :rtype: list
+        """
+
+        return await self._make_request('GET', USERS_URL, unwrap='data')
+
+    async def create_user(self, username, password, email=None, enabled=True, hints=True, lang='en_US', roles=None,
+                          superuser=False):
+        """
+        Async version of `CraftyWeb.create_user`, see it for the meaning of each parameter.
+
+        :return: A dictionary containing the newly created user's id number (user_id).
+        :rtype: dict
+        :raises: ValueError if 'roles' contains an invalid role (only checked when `validate_roles` is enabled).
+        """
+
+        request = self._prepare_create_user(username, password, email, enabled, hints, lang, roles, superuser)
+
+        # The server rejects unknown roles itself, checking them here costs an extra request
+        if request.data.get('roles') and self.validate_roles:
+            roles_list = await self._make_request('GET', ROLES_URL, unwrap='data', log_response=False)
+            self._check_roles(request.data['roles'], self._role_ids(roles_list))
+
+        return await self._make_request(*request)
+
+    async def get_user(self, user_id):
+        """
+        Async version of `CraftyWeb.get_user`.
+
+        :param user_id: The ID number of the user to retrieve.
+        :type user_id: int | str
+        :return: A dictionary containing the details of the retrieved user.
+        :rtype: dict
+        """
+
+        self._ensure_id(user_id, 'user_id')
+
+        url = USER_URL % user_id
+        return await self._make_request('GET', url, unwrap='data')
+
+    async def get_users_bulk(self, user_ids):
+        """
+        Async version of `CraftyWeb.get_users_bulk`, the users are fetched concurrently.
+
+        :param user_ids: The IDs of the users to retrieve.
+        :type user_ids: list[int | str]
+        :return: A list of dictionaries containing the details of each user, in the same order as `user_ids`.
+        :rtype: list[dict]
+        """
+
+        return await self._fetch_bulk(self.get_user, user_ids)
+
+    async def delete_user(self, user_id):
+        """
+        Async version of `CraftyWeb.delete_user`.
+
+        :param user_id: The ID number of the user to be deleted.
+        :type user_id: int | str
+        :return: A dictionary containing the response from the server.
+        :rtype: dict
+        """
+
+        self._ensure_id(user_id, 'user_id')
+
+        url = USER_URL % user_id
+        response = await self._make_request('DELETE', url)
+        if response['status'] == 'ok':
+            _log.info('Successfully Removed User with user ID: %s', user_id)
+        return response
+
+    async def modify_user(self, user_id, username=None, password=None, email=None, enabled=None, superuser=None,
+                          lang=None, hints=None, roles=None, permissions=None, remove_roles=False):
+        """
+        Async version of `CraftyWeb.modify_user`, see it for the meaning of each parameter.
+
+        :return: A dictionary containing the response from the server.
+        :rtype: dict
+        :raises AccessDenied: If the user does not have the necessary permissions to modify the user.
+        """
+
+        request = self._prepare_modify_user(user_id, username, password, email, enabled, superuser, lang, hints, roles,
+                                            permissions)
+
+        # Check to see if the user already has any of the passed roles, if so remove them from the new roles
+        if not remove_roles and request.data.get('roles'):
+            prev_user = await self._make_request('GET', USER_URL % user_id, unwrap='data', log_response=False)
+            self._drop_existing_roles(request, user_id, prev_user)
+
+        return await self._make_request(*request)
+
+    @_user_getter(USER_PERMISSIONS_URL)
+    def get_user_crafty_permissions(self, user_id):
+        """
+        Async version of `CraftyWeb.get_user_crafty_permissions`.
+
+        :param user_id: The ID of the user to retrieve permissions for.
+        :type user_id: int | str
+        :return: A dictionary containing the user's Crafty permissions.
+        :rtype: dict
+        """
+
+    @_user_getter(USER_PFP_URL)
+    def get_user_profile_picture(self, user_id):
+        """
+        Async version of `CraftyWeb.get_user_profile_picture`.
+
+        :param user_id: The user ID of the user to retrieve the profile picture for.
+        :type user_id: int | str
+        :return: A link to the profile picture of the user corresponding to the specified user ID.
+        :rtype: str
+        """
+
+    @_user_getter(USER_PUBLIC_URL)
+    def get_user_public_data(self, user_id):
+        """
+        Async version of `CraftyWeb.get_user_public_data`.
+
+        :param user_id: The user ID of the user to retrieve the public data for.
+        :type user_id: int or str
+        :return: A dictionary containing the public data of the requested user.
+        :rtype: dict
+        """
+
+    async def get_users_crafty_permissions(self, user_ids):
+        """
+        Async version of `CraftyWeb.get_users_crafty_permissions`.
+
+        :param user_ids: The IDs of the users to retrieve permissions for.
+        :type user_ids: list[int | str]
+        :return: A list of dictionaries containing each user's Crafty permissions, in the same order as `user_ids`.
+        :rtype: list[dict]
+        """
+
+        return await self._fetch_bulk(self.get_user_crafty_permissions, user_ids)
+
+    async def get_users_profile_pictures(self, user_ids):
+        """
+        Async version of `CraftyWeb.get_users_profile_pictures`.
+
+        :param user_ids: The IDs of the users to retrieve the profile pictures for.
+        :type user_ids: list[int | str]
+        :return: A list of links to each user's profile picture, in the same order as `user_ids`.
+        :rtype: list[str]
+        """
+
+        return await self._fetch_bulk(self.get_user_profile_picture, user_ids)
+
+    async def get_users_public_data(self, user_ids):
+        """
+        Async version of `CraftyWeb.get_users_public_data`.
+
+        :param user_ids: The IDs of the users to retrieve the public data for.
+        :type user_ids: list[int | str]
+        :return: A list of dictionaries containing each user's public data, in the same order as `user_ids`.
+        :rtype: list[dict]
+        """
+
+        return await self._fetch_bulk(self.get_user_public_data, user_ids)
+
+    # JSON Schema Functions
+
+    async def get_json_schemas(self):
+        """
+        Async version of `CraftyWeb.get_json_schemas`.
+
+        :return: A list containing all valid JSON schemas
+        :rtype: list
+        """
+        url = SCHEMA_URL
+        return await self._make_request('GET', url, unwrap='data')
+
+    async def json_schema(self, schema):
+        """
+        Async version of `CraftyWeb.json_schema`.
+
+        :param schema: A string representing the schema to retrieve.
+        :type schema: str
+        :return: A dictionary representing the JSON schema for the given endpoint.
+        :rtype: dict
+        :raises ValueError: If the input `schema` is not a valid option.
+        :raises TypeError: If the input 'schema' is not a string.
+        """
+
+        if not self._schema_is_known(schema):
+            self._check_schema(schema, await self._make_request('GET', SCHEMA_URL, unwrap='data', log_response=False))
+
+        return self._print_schema(await self._make_request('GET', SCHEMA_NAME_URL % schema))
@@ -1,78 +1,516 @@
-import requests
+import functools
 import json
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Final, NamedTuple, Optional, Tuple, Type, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from crafty_client.static.cache import TTLCache, cached
 from crafty_client.static.exceptions import *
-from crafty_client.static.routes import APIRoutes
+from crafty_client.static.json_utils import dumps, loads
+from crafty_client.static.routes import (APIRoutes, BASE_URL, INVALIDATE_TOKENS_URL, LOGIN_URL, ROLES_URL,
+    ROLE_SERVERS_URL, ROLE_URL, ROLE_USERS_URL, SCHEMA_NAME_URL, SCHEMA_URL, SERVERS_URL, SERVER_ACTION_URL,
+    SERVER_LOGS_URL, SERVER_PUBLIC_URL, SERVER_STATS_URL, SERVER_STDIN_URL, SERVER_TASKS_URL, SERVER_TASK_URL,
+    SERVER_URL, SERVER_USERS_URL, USERS_URL, USER_PERMISSIONS_URL, USER_PFP_URL, USER_PUBLIC_URL, USER_URL)
+
+__all__ = ['CraftyWeb', 'APIRoutes', 'AccessDenied', 'IncorrectCredentials', 'MissingParameters', 'NotAllowed',
+           'ServerAlreadyRunning', 'ServerNotFound', 'ServerNotRunning']
+
+_log = logging.getLogger(__name__)
+
+
+def _user_getter(route):
+    """
+    Replaces the decorated stub with a getter for the per-user `route` template, keeping the stub's name and docstring.
+
+    The endpoints under /users/<id>/ only differ in their route, so they all share the body generated here.
+    """
+
+    def decorator(stub):
+        @functools.wraps(stub)
+        def getter(self, user_id):
+            self._ensure_id(user_id, 'user_id')
+            return self._make_request('GET', route % user_id, unwrap='data')
+
+        return getter
+
+    return decorator
+
+
+class _Request(NamedTuple):
+    # An API call prepared by one of the `_prepare_*` helpers, the fields line up with the leading parameters of both
+    # clients' `_make_request` so it can be sent with `_make_request(*request)`
+    method: str
+    api_route: str
+    params: Optional[Dict[str, str]] = None
+    data: Optional[Any] = None
+    not_json: Optional[str] = None
+
+
+class _CraftyWebBase:
+    """
+    Argument validation, request building and response handling shared by `CraftyWeb` and `AsyncCraftyWeb`.
+
+    Each API method of the two clients prepares its request with one of the helpers below and only differs in how the
+    request is sent.
+    """
+    __slots__ = ()
+
+    # Request body keys of the methods built with _compact_payload, in the order their values are passed
+    _MODIFY_SERVER_KEYS = ('server_name', 'path', 'backup_path', 'executable', 'log_path', 'execution_command',
+                           'java_selection', 'auto_start', 'auto_start_delay', 'crash_detection', 'stop_command',
+                           'executable_update_url', 'server_ip', 'server_port', 'logs_delete_after', 'ignored_exits',
+                           'show_status', 'shutdown_timeout')
+    _CREATE_USER_KEYS = ('username', 'password', 'email', 'enabled', 'hints', 'lang', 'roles', 'superuser')
+    _MODIFY_USER_KEYS = ('username', 'password', 'email', 'enabled', 'superuser', 'lang', 'hints', 'roles',
+                         'permissions')
+    # Expected types of modify_server's optional arguments, matching _MODIFY_SERVER_KEYS
+    _MODIFY_SERVER_TYPES = (str, str, str, str, str, str, str, bool, int, bool, str, str, str, int, int, str, bool, int)
+    # Expected types of modify_user's optional scalar arguments, matching the start of _MODIFY_USER_KEYS
+    _MODIFY_USER_TYPES = (str, str, str, bool, bool, str, bool)
+    _USER_PERMISSION_KEYS = frozenset({'enabled', 'name', 'quantity'})
+    # Schemas known to exist, any other name is checked against the server's list before it is requested
+    _KNOWN_SCHEMAS = frozenset({'login', 'modify_role', 'create_role', 'server_patch', 'new_server', 'user_patch',
+                                'new_user', 'task_patch'})
+    _VALID_ACTIONS = frozenset({'clone_server', 'start_server', 'stop_server', 'restart_server', 'kill_server',
+                                'backup_server', 'update_executable'})
+    # Retry policy shared by both transports. Requests that change something are only retried when the connection
+    # couldn't be established, the server may have already applied them otherwise.
+    _RETRY_BACKOFF = 0.3
+    _RETRY_STATUSES = frozenset({502, 503, 504})
+    _RETRY_METHODS = frozenset({'GET', 'HEAD'})
+
+    # Maps API error codes to the exception raised for them and its argument. True passes the response's 'info' to
+    # the exception, a string is used as the message and None raises the exception without arguments.
+    # TODO: Verify all these errors still exist (mostly copied from API V1)
+    # TODO: Add 'INVALID_JSON_SCHEMA'
+    _ERROR_MAP: Final[Dict[str, Tuple[Type[Exception], Union[str, bool, None]]]] = {
+        'INCORRECT_CREDENTIALS': (IncorrectCredentials, None),
+        'SER_NOT_RUNNING': (ServerNotRunning, None),
+        'NO_COMMAND': (MissingParameters, 'Your request is missing essential parameters or they are invalid'),
+        'SER_RUNNING': (ServerAlreadyRunning, None),
+        'NOT_AUTHORIZED': (AccessDenied, None),
+        'ACCESS_DENIED': (AccessDenied, True),
+        'NOT_ALLOWED': (NotAllowed, True),
+        'NOT_FOUND': (ServerNotFound, True),
+    }
+
+    def _check_errors(self, response_dict: Dict[str, Any]) -> None:
+        # Successful responses carry no error, skip the table lookup for them
+        error = response_dict.get('error')
+        if not error:
+            return
+
+        entry = self._ERROR_MAP.get(error)
+        if entry is None:
+            return
+
+        exception, argument = entry
+        if argument is True:
+            raise exception(response_dict['info'])
+        elif argument is not None:
+            raise exception(argument)
+        raise exception()
+
+    @staticmethod
+    def _ensure_id(value: Union[int, str], name: str) -> Union[int, str]:
+        # Exact type checks first, they are cheaper than isinstance and cover nearly every call
+        if type(value) is int or type(value) is str or isinstance(value, (int, str)):
+            return value
+        raise TypeError(f'Expected "{name}" to be of type int or str, but got {type(value).__name__} instead')
+
+    @staticmethod
+    def _ensure_optional_types(names, types, values):
+        # Checks the optional arguments of a method against their expected types, None means the argument wasn't given
+        for name, arg_type, value in zip(names, types, values):
+            if value is not None and type(value) is not arg_type and not isinstance(value, arg_type):
+                raise TypeError(f'Expected "{name}" to be of type {arg_type.__name__} or None, but got '
+                                f'{type(value).__name__} instead')
+
+    @staticmethod
+    def _normalize_roles(roles: Union[int, str, list]) -> list:
+        # A single role is wrapped, lists of strings are passed through as-is and anything else is converted in one go
+        roles_type = type(roles)
+        if roles_type is int or roles_type is str or isinstance(roles, (int, str)):
+            return [str(roles)]
+        if roles_type is list or isinstance(roles, list):
+            return roles if all(type(role) is str for role in roles) else list(map(str, roles))
+        raise TypeError(f"Expected 'roles' to be of type list[int], but got {roles_type.__name__} instead")
+
+    @staticmethod
+    def _normalize_server_ids(server_ids):
+        if isinstance(server_ids, (int, str)):
+            return [server_ids]
+        if not isinstance(server_ids, list):
+            raise TypeError(f"'server_ids' must either be of type int or a list of int instead was of type "
+                            f"{type(server_ids).__name__}")
+        return server_ids
+
+    @staticmethod
+    def _compact_payload(keys, values):
+        # Builds the request body in a single pass, leaving out the arguments that weren't given
+        return {key: value for key, value in zip(keys, values) if value is not None}
+
+    # Authentication
+
+    @staticmethod
+    def _prepare_login(username, password, password_path):
+        if password_path:
+            # Read as text, bytes can't be serialized to JSON. Drop the trailing newline most editors add.
+            with open(password_path, 'r', encoding='utf-8') as file:
+                password = file.read().rstrip('\r\n')
+        if password is None and password_path is None:
+            raise ValueError('Must either have a password or path to the file where a password is saved')
+
+        return _Request('POST', LOGIN_URL, data={'username': username, 'password': password})
+
+    @staticmethod
+    def _token_from_login(response):
+        if response.get('data') is not None:
+            try:
+                return response['data']['token']
+            except TypeError as e:
+                if 'NoneType' in str(e) and response.get('error') == 'INCORRECT_CREDENTIALS':
+                    raise IncorrectCredentials("Incorrect username or password. Please try again.")
+                raise e
+        elif response.get('error') == 'INCORRECT_CREDENTIALS':
+            raise IncorrectCredentials("Incorrect username or password. Please try again.")
+        else:
+            raise Exception('Debug This')
+
+    def _check_log_out(self, response):
+        if response['status'] == 'ok':
+            _log.info('Successfully logged out user')
+            return response
+        elif response['status'] == 'error':
+            self._check_errors(response)
+        else:
+            raise Exception('Debug This')
+
+    # Roles
+
+    def _prepare_create_role(self, name, server_ids, permissions, manager):
+        server_ids = self._normalize_server_ids(server_ids)
+
+        servers = [
+            {'server_id': int(server_id), 'permissions': str(permissions)} for server_id in server_ids]
+        data = {
+            'name': name,
+            'servers': servers,
+            'manager': int(manager)
+        }
+        return _Request('POST', ROLES_URL, data=data)
+
+    def _prepare_modify_role(self, role_id, name, server_ids, permissions):
+        self._ensure_id(role_id, 'role_id')
+        if name is not None and not isinstance(name, str):
+            raise TypeError(f"'name' must be of type string, instead was of type {type(name).__name__}")
+        if (server_ids is None and permissions is not None) or (server_ids is not None and permissions is None):
+            raise ValueError("Both 'server_ids' and 'permissions' must be either provided or None.")
+        elif server_ids is not None and permissions is not None:
+            server_ids = self._normalize_server_ids(server_ids)
+            if isinstance(permissions, int):
+                permissions = str(permissions)
+            if isinstance(permissions, str):
+                permissions = [permissions] * len(server_ids)
+            elif not isinstance(permissions, list):
+                raise TypeError(f"'permissions' must either be of type str or a list of str instead was of type "
+                                f"{type(permissions).__name__}")
+            elif len(permissions) != len(server_ids):
+                raise ValueError(
+                    '''If 'server_ids' and 'permissions' are both provided as lists, they must have the same length.
+                        Otherwise permissions can be a single string if the role should have the same permissions for
+                        all servers.''')
+
+        data = {}
+        if name is not None:
+            data['name'] = name
+        if server_ids is not None:
+            data['servers'] = [{'id': server_id, 'permissions': permission}
+                               for server_id, permission in zip(server_ids, permissions)]
+        return _Request('PATCH', ROLE_URL % role_id, data=data)
+
+    # Servers
 
+    def _prepare_modify_server(self, server_id, values):
+        # `values` are modify_server's optional arguments in signature order
+        self._ensure_id(server_id, 'server_id')
+        self._ensure_optional_types(self._MODIFY_SERVER_KEYS, self._MODIFY_SERVER_TYPES, values)
+        return _Request('PATCH', SERVER_URL % server_id, data=self._compact_payload(self._MODIFY_SERVER_KEYS, values))
 
-class CraftyWeb:
+    def _prepare_server_action(self, server_id, action):
+        if action not in self._VALID_ACTIONS:
+            raise ValueError(f'Invalid action "{action}". Valid actions are: {", ".join(sorted(self._VALID_ACTIONS))}')
+        self._ensure_id(server_id, 'server_id')
+        return _Request('POST', SERVER_ACTION_URL % (server_id, action))
 
-    def __init__(self, url, api_token, verify_ssl=False, server_response=True, debug=False):
-        """ The main class for communicating with the Crafty Web API"""
+    def _prepare_server_logs(self, server_id, file, colors, raw, html):
+        self._ensure_id(server_id, 'server_id')
+        # The API only treats lowercase 'true' as enabled
+        params = {k: str(v).lower() for k, v in (('file', file), ('colors', colors), ('raw', raw), ('html', html)) if v}
+        return _Request('GET', SERVER_LOGS_URL % server_id, params=params)
+
+    @staticmethod
+    def _usernames(users_data):
+        return {user_data['user_id']: user_data['username'] for user_data in users_data}
+
+    # Users
+
+    def _prepare_create_user(self, username, password, email, enabled, hints, lang, roles, superuser):
+        if roles is not None:
+            roles = self._normalize_roles(roles)
+        values = (username, password, email, enabled, hints, lang, roles, superuser)
+        return _Request('POST', USERS_URL, data=self._compact_payload(self._CREATE_USER_KEYS, values))
+
+    @staticmethod
+    def _role_ids(roles_list):
+        return {str(role['role_id']) for role in roles_list or []}
+
+    @staticmethod
+    def _check_roles(roles, valid_roles):
+        invalid_roles = [role for role in roles if role not in valid_roles]
+        if invalid_roles:
+            raise ValueError(f"Invalid role(s): {', '.join(invalid_roles)}. Valid role(s): "
+                             f"{', '.join(sorted(valid_roles))}.")
+
+    def _prepare_modify_user(self, user_id, username, password, email, enabled, superuser, lang, hints, roles,
+                             permissions):
+        self._ensure_id(user_id, 'user_id')
+        scalars = (username, password, email, enabled, superuser, lang, hints)
+        self._ensure_optional_types(self._MODIFY_USER_KEYS, self._MODIFY_USER_TYPES, scalars)
+        if roles is not None:
+            roles = self._normalize_roles(roles)
+        if permissions is not None:
+            if type(permissions) is not dict and not isinstance(permissions, dict):
+                raise TypeError(f"Expected 'permissions' to be of type dict, but got {type(permissions).__name__} "
+                                f"instead")
+            if not permissions.keys() >= self._USER_PERMISSION_KEYS:
+                raise ValueError("permissions dictionary must contain 'enabled', 'name', and 'quantity' keys")
+            if type(permissions["enabled"]) is not bool:
+                raise TypeError("The 'enabled' key in the permissions dictionary must be a boolean.")
+            if type(permissions["name"]) is not str and not isinstance(permissions["name"], str):
+                raise TypeError("The 'name' key in the permissions dictionary must be a string.")
+            if type(permissions["quantity"]) is not int and not isinstance(permissions["quantity"], int):
+                raise TypeError("The 'quantity' key in the permissions dictionary must be an integer.")
+
+        values = scalars + (roles, permissions)
+        return _Request('PATCH', USER_URL % user_id, data=self._compact_payload(self._MODIFY_USER_KEYS, values))
+
+    @staticmethod
+    def _drop_existing_roles(request, user_id, prev_user):
+        # Removes the roles the user already has from a prepared modify_user request, sending them would remove them
+        prev_role_ids = {str(prev_role['role_id']) for prev_role in prev_user['roles']}
+        new_roles = []
+        for role in request.data['roles']:
+            if role not in prev_role_ids:
+                new_roles.append(role)
+            else:
+                _log.warning('User %s already has role %s. If you intend on removing it, set parameter '
+                             '"remove_roles" to True.', user_id, role)
+        if new_roles:
+            request.data['roles'] = new_roles
+        else:
+            del request.data['roles']
+
+    # JSON schemas
+
+    def _schema_is_known(self, schema):
+        if type(schema) is not str and not isinstance(schema, str):
+            raise TypeError(f"Expected `schema` to be a string, but got {type(schema).__name__}")
+        return schema in self._KNOWN_SCHEMAS
+
+    @staticmethod
+    def _check_schema(schema, valid_schemas):
+        if schema not in valid_schemas:
+            raise ValueError(f"Invalid schema. Must be one of the following: {valid_schemas}")
+
+    @staticmethod
+    def _print_schema(response):
+        if response['status'] == 'ok':
+            print(json.dumps(response['data'], indent=4))
+        return response
+
+
+class CraftyWeb(_CraftyWebBase):
+    # Every instance attribute is declared up front, which drops the per-instance __dict__
+    __slots__ = ('url', '_base_url', 'token', 'verify_ssl', 'headers', 'debug', 'server_response', 'validate_roles',
+                 '_timeout', '_session', '_request', '_pool_maxsize', 'cache_ttl', '_cache')
+
+    # Default time to live (in seconds) of cached responses for each cache tag, 0 disables caching for the tag
+    CACHE_TTL = {'roles': 300, 'servers': 60, 'users': 60}
+    # Size of the chunks read from streamed (potentially very large) responses such as server logs
+    STREAM_CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, url, api_token, verify_ssl=False, server_response=True, debug=False, cache=False,
+                 cache_maxsize=256, cache_ttl=None, validate_roles=False, pool_maxsize=64, max_retries=3, timeout=None,
+                 warmup=False):
+        """
+        The main class for communicating with the Crafty Web API
+
+        The client keeps its connections open between calls, release them with `close()` or by using the client as a
+        context manager. `timeout` (in seconds) applies to every request, None waits indefinitely.
+
+        Up to `pool_maxsize` connections to the server are kept open for reuse. Failed connection attempts are retried
+        up to `max_retries` times with a short backoff. Read-only requests (GET/HEAD) are also retried on read errors
+        and 502/503/504 responses, changes are not, since the server may have already applied them.
+
+        If `validate_roles` is True, `create_user` checks the given roles against `get_all_roles` before sending the
+        request, otherwise unknown roles are left to the server to reject. Enable `cache` as well when creating many
+        users so the roles are only fetched once.
+
+        If `cache` is True, the read-only role, server and user getters are cached for the time to live given in
+        `cache_ttl` (which updates the `CACHE_TTL` defaults). Cached results are shared objects and should not be
+        modified. Modifications made through this client invalidate the affected entries.
+
+        If `warmup` is True, `warmup()` is run in a background thread so the first API call finds an open connection.
+        """
         self.url = url
+        # Routes all start with a '/', strip it from the base once so the endpoint is a plain concatenation
+        self._base_url = url.rstrip('/')
         self.token = api_token
         self.verify_ssl = verify_ssl
         self.headers = {'Authorization': f'Bearer {self.token}', 'Content-Type': 'application/json'}
         self.debug = debug
         self.server_response = server_response
+        self.validate_roles = validate_roles
+        self._timeout = timeout
+
+        self._session = requests.Session()
+        self._session.headers.update(self.headers)
+        self._session.headers['Accept'] = 'application/json'
+        self._session.verify = self.verify_ssl
+
+        self._pool_maxsize = pool_maxsize
+        retry = Retry(total=max_retries, backoff_factor=self._RETRY_BACKOFF, status_forcelist=self._RETRY_STATUSES,
+                      allowed_methods=self._RETRY_METHODS)
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=pool_maxsize, max_retries=retry)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+        # Bound once so every request skips looking up the session and creating a new bound method
+        self._request = self._session.request
+
+        self.cache_ttl = {**self.CACHE_TTL, **(cache_ttl or {})}
+        self._cache = TTLCache(cache_maxsize) if cache else None
+
+        if warmup:
+            threading.Thread(target=self.warmup, name='crafty-client-warmup', daemon=True).start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _make_request(self, method: str, api_route: str, params: Optional[Dict[str, str]] = None,
+                      data: Optional[Any] = None, not_json: Optional[str] = None,
+                      headers: Optional[Dict[str, Optional[str]]] = None, stream: bool = False,
+                      unwrap: Optional[str] = None, log_response: bool = True) -> Any:
+        # `unwrap` names a key of the response (usually 'data') to return instead of the whole response.
+        # `log_response=False` keeps internal lookups out of the `server_response` log without touching shared state.
+        endpoint = self._base_url + api_route
+
+        body = dumps(data) if data is not None else not_json
+
+        with self._request(method, endpoint, headers=headers, params=params, data=body, stream=stream,
+                           timeout=self._timeout) as route:
+            if stream:
+                # Growing a single buffer avoids holding every chunk plus their joined copy for large bodies
+                content = bytearray()
+                for chunk in route.iter_content(self.STREAM_CHUNK_SIZE):
+                    content.extend(chunk)
+            else:
+                content = route.content
+            # Decoding the whole body is only worth it when the debug output is actually going to be emitted
+            if self.debug and _log.isEnabledFor(logging.DEBUG):
+                _log.debug('Debug: \n%s', content.decode(route.encoding or 'utf-8', errors='replace'))
+            response_dict = loads(content)
+            if log_response and self.server_response:
+                _log.info('%s', response_dict)
 
-    # TODO: Verify all these errors still exist (mostly copied from API V1)
-    def _check_errors(self, response_dict):
-        if response_dict['error'] == 'INCORRECT_CREDENTIALS':
-            raise IncorrectCredentials()
-        elif response_dict['error'] == 'SER_NOT_RUNNING':
-            raise ServerNotRunning()
-        elif response_dict['error'] == 'NO_COMMAND':
-            raise MissingParameters("Your request is missing essential parameters or they are invalid")
-        elif response_dict['error'] == 'SER_RUNNING':
-            raise ServerAlreadyRunning()
-        elif response_dict['error'] == 'NOT_AUTHORIZED':
-            raise AccessDenied()
-        elif response_dict['error'] == 'ACCESS_DENIED':
-            print(f'Access Denied')
-            raise AccessDenied(response_dict['info'])
-        elif response_dict['error'] == 'NOT_ALLOWED':
-            raise NotAllowed(response_dict['info'])
-        elif response_dict['error'] == 'NOT_FOUND':
-            raise ServerNotFound(response_dict['info'])
-        # Add elif response_dict['error'] == 'INVALID_JSON_SCHEMA':
-        else:
-            pass
+            # Callers index these keys directly, but error responses carry no 'data' and other keys may be left out
+            for key in ('status', 'data', 'error'):
+                response_dict.setdefault(key, None)
+            if not response_dict.get('info'):
+                response_dict['info'] = response_dict.get('error_data')
+
+            if response_dict.get('error'):
+                self._check_errors(response_dict)
+            return response_dict.get(unwrap) if unwrap else response_dict
+
+    def _fetch_bulk(self, getter, ids):
+        # The session's connection pool is thread-safe, so independent GETs can wait on the network in parallel
+        ids = list(ids)
+        if not ids:
+            return []
+        with ThreadPoolExecutor(max_workers=min(self._pool_maxsize, len(ids))) as executor:
+            return list(executor.map(getter, ids))
+
+    def _invalidate_cache(self, *tags):
+        if self._cache is not None:
+            for tag in tags:
+                self._cache.invalidate(tag)
+
+    def cache_info(self):
+        """
+        Returns statistics about the response cache.
+
+        :return: A dictionary with the number of cache 'hits', 'misses' and currently stored entries ('size'), or None
+            if caching is disabled.
+        :rtype: dict | None
+        """
+
+        if self._cache is None:
+            return None
+        return {'hits': self._cache.hits, 'misses': self._cache.misses, 'size': len(self._cache)}
 
-    def _make_request(self, method, api_route, params=None, data=None, not_json=None):
-        endpoint = f'{self.url}{api_route}'
+    def clear_cache(self):
+        """
+        Removes every entry from the response cache.
+        """
+
+        if self._cache is not None:
+            self._cache.clear()
+
+    def warmup(self):
+        """
+        Opens a connection to the server ahead of the first API call.
+
+        Sends a HEAD request to the API so the DNS lookup and TCP/TLS handshake are done up front and the connection is
+        left in the pool for the next request. Failures are only logged, the next real request retries the connection.
+
+        :return: True if the server could be reached, otherwise False.
+        :rtype: bool
+        """
 
-        with requests.request(method, endpoint, verify=self.verify_ssl, headers=self.headers, params=params,
-                              json=data, data=not_json) as route:
-            if self.debug:
-                print(f'Debug: \n{route.text}')
-            response_dict = route.json()
-            if self.server_response:
-                print(response_dict)
+        try:
+            self._request('HEAD', self._base_url + BASE_URL, timeout=self._timeout).close()
+        except requests.RequestException as e:
+            _log.debug('Connection warmup failed: %s', e)
+            return False
+        return True
 
-            status = response_dict.get('status', None)
-            data = response_dict.get('data', None)
-            error = response_dict.get('error', None)
-            info = response_dict.get('info', None) or response_dict.get('error_data', None)
+    def close(self):
+        """
+        Closes the underlying session and all of its pooled connections.
+        """
 
-            self._check_errors({'status': status, 'data': data, 'error': error, 'info': info})
-            return {'status': status, 'data': data, 'error': error, 'info': info}
+        self._session.close()
 
-    def _silence_response(self):
-        class SilenceResponse:
-            def __init__(self, obj):
-                self.obj = obj
-                self.original_state = obj.server_response
+    def get_session(self):
+        """
+        Returns the underlying `requests.Session` used for all API calls.
 
-            def __enter__(self):
-                obj = self.obj
-                obj.server_response = False
+        Useful for mounting a custom `HTTPAdapter` (pool sizes, retries, etc.) on the session.
 
-            def __exit__(self, type, value, traceback):
-                obj = self.obj
-                obj.server_response = self.original_state
+        :return: The session shared by every request made by this client.
+        :rtype: requests.Session
+        """
 
-        return SilenceResponse(self)
+        return self._session
 
     def get_token(self, username, password=None, password_path=None):
         """
@@ -91,32 +529,16 @@ class CraftyWeb:
         :raises IncorrectCredentials: If the username or password are incorrect.
         """
 
-        self.headers = None
-
-        if password_path:
-            with open(password_path, 'rb') as file:
-                password = file.read()
-        if password is None and password_path is None:
-            raise ValueError('Must either have a password or path to the file where a password is saved')
-
-        data = {
-            'username': username,
-            'password': password
-        }
+        request = self._prepare_login(username, password, password_path)
+        # Login must not carry the current bearer token, setting it to None drops it for this request only
+        token = self._token_from_login(self._make_request(*request, headers={'Authorization': None}))
 
-        response = self._make_request('POST', APIRoutes.LOGIN_URL, data=data)
-
-        if response.get('data') is not None:
-            try:
-                return response['data']['token']
-            except TypeError as e:
-                if 'NoneType' in str(e) and response.get('error') == 'INCORRECT_CREDENTIALS':
-                    raise IncorrectCredentials("Incorrect username or password. Please try again.")
-                raise e
-        elif response.get('error') == 'INCORRECT_CREDENTIALS':
-            raise IncorrectCredentials("Incorrect username or password. Please try again.")
-        else:
-            raise Exception('Debug This')
+        self.token = token
+        self.headers['Authorization'] = f'Bearer {token}'
+        self._session.headers['Authorization'] = self.headers['Authorization']
+        # Cache keys don't include the token, responses fetched as the previous user must not be served to this one
+        self.clear_cache()
+        return token
 
     def log_out(self):
         """
@@ -126,19 +548,11 @@ class CraftyWeb:
         :rtype: dict
         """
 
-        url = f'{APIRoutes.AUTH_URL}/invalidate_tokens'
-        response = self._make_request('POST', url)
-
-        if response['status'] == 'ok':
-            print('Successfully logged out user')
-            return response
-        elif response['status'] == 'error':
-            self._check_errors(response)
-        else:
-            raise Exception('Debug This')
+        return self._check_log_out(self._make_request('POST', INVALIDATE_TOKENS_URL))
 
     # Role Functions
 
+    @cached('roles')
     def get_all_roles(self):
         """
         Retrieves a list of all roles.
@@ -147,7 +561,12 @@ class CraftyWeb:
         :rtype: list[dict]
         """
 
-        return self._make_request('GET', APIRoutes.ROLES_URL)['data']
+        return self._make_request('GET', ROLES_URL, unwrap='data')
+
+    @cached('roles')
+    def _get_valid_role_ids(self):
+        # Role IDs as strings for create_user's validation, cached separately from (and not logged like) get_all_roles
+        return self._role_ids(self._make_request('GET', ROLES_URL, unwrap='data', log_response=False))
 
     def create_role(self, name, server_ids, permissions, manager):
         """
@@ -168,22 +587,11 @@ class CraftyWeb:
         :return: A dictionary containing the response from the server.
         :rtype: dict
         """
-        if isinstance(server_ids, (int, str)):
-            server_ids = [server_ids]
-        elif not isinstance(server_ids, list):
-            raise TypeError(f"'server_ids' must either be of type int or a list of int instead was of type "
-                            f"{type(server_ids).__name__}")
-
-        servers = [
-            {'server_id': int(server_id), 'permissions': str(permissions)} for server_id in server_ids]
-        data = {
-            'name': name,
-            'servers': servers,
-            'manager': int(manager)
-        }
-
-        return self._make_request('POST', APIRoutes.ROLES_URL, data=data)
+        response = self._make_request(*self._prepare_create_role(name, server_ids, permissions, manager))
+        self._invalidate_cache('roles')
+        return response
 
+    @cached('roles')
     def get_role(self, role_id):
         """
         Retrieves information about the role corresponding to the given role ID.
@@ -194,12 +602,12 @@ class CraftyWeb:
         :rtype: dict
         """
 
-        if not isinstance(role_id, (int, str)):
-            raise TypeError(f'Expected "role_id" to be of type int or str, but got {type(role_id).__name__} instead')
+        self._ensure_id(role_id, 'role_id')
 
-        url = f'{APIRoutes.ROLES_URL}/{role_id}'
-        return self._make_request('GET', url)['data']
+        url = ROLE_URL % role_id
+        return self._make_request('GET', url, unwrap='data')
 
+    @cached('roles')
     def get_roles_servers(self, role_id):
         """
         Retrieve a list of all servers that the role corresponding to the given role ID has access to.
@@ -211,12 +619,12 @@ class CraftyWeb:
         :rtype: list[dict]
         """
 
-        if not isinstance(role_id, (int, str)):
-            raise TypeError(f'Expected "role_id" to be of type int or str, but got {type(role_id).__name__} instead')
+        self._ensure_id(role_id, 'role_id')
 
-        url = f'{APIRoutes.ROLES_URL}/{role_id}/servers'
-        return self._make_request('GET', url)['data']
+        url = ROLE_SERVERS_URL % role_id
+        return self._make_request('GET', url, unwrap='data')
 
+    @cached('roles')
     def get_role_users(self, role_id):
         """
         Retrieves a list of user IDs with access to the role corresponding to the given role ID.
@@ -227,11 +635,22 @@ class CraftyWeb:
         :rtype: list[int]
         """
 
-        if not isinstance(role_id, (int, str)):
-            raise TypeError(f'Expected "role_id" to be of type int or str, but got {type(role_id).__name__} instead')
+        self._ensure_id(role_id, 'role_id')
+
+        url = ROLE_USERS_URL % role_id
+        return self._make_request('GET', url, unwrap='data')
+
+    def get_roles_bulk(self, role_ids):
+        """
+        Retrieves information about several roles at once, fetching them concurrently.
+
+        :param role_ids: The IDs of the roles to retrieve.
+        :type role_ids: list[int | str]
+        :return: A list of dictionaries containing information about each role, in the same order as `role_ids`.
+        :rtype: list[dict]
+        """
 
-        url = f'{APIRoutes.ROLES_URL}/{role_id}/users'
-        return self._make_request('GET', url)['data']
+        return self._fetch_bulk(self.get_role, role_ids)
 
     def delete_role(self, role_id):
         """
@@ -244,13 +663,13 @@ class CraftyWeb:
         :raises AccessDenied: If the user does not have permission to delete roles. (Superuser required)
         """
 
-        if not isinstance(role_id, (int, str)):
-            raise TypeError(f'Expected "role_id" to be of type int or str, but got {type(role_id).__name__} instead')
+        self._ensure_id(role_id, 'role_id')
 
-        url = f'{APIRoutes.ROLES_URL}/{role_id}'
+        url = ROLE_URL % role_id
         response = self._make_request('DELETE', url)
+        self._invalidate_cache('roles', 'users')
         if response['status'] == 'ok':
-            print(f'Successfully Removed Role with role ID: {role_id}')
+            _log.info('Successfully Removed Role with role ID: %s', role_id)
         return response
 
     def modify_role(self, role_id, name=None, server_ids=None, permissions=None):
@@ -279,45 +698,13 @@ class CraftyWeb:
         :raises AccessDenied: If the user does not have the necessary permissions to modify the role.
         """
 
-        if not isinstance(role_id, (int, str)):
-            raise TypeError(f'Expected "role_id" to be of type int or str, but got {type(role_id).__name__} instead')
-        if name is not None and not isinstance(name, str):
-            raise TypeError(f"'name' must be of type string, instead was of type {type(name).__name__}")
-        if (server_ids is None and permissions is not None) or (server_ids is not None and permissions is None):
-            raise ValueError("Both 'server_ids' and 'permissions' must be either provided or None.")
-        elif server_ids is not None and permissions is not None:
-            if isinstance(server_ids, (int, str)):
-                server_ids = [server_ids]
-            elif not isinstance(server_ids, list):
-                raise TypeError(f"'server_ids' must either be of type int or a list of int instead was of type "
-                                f"{type(server_ids).__name__}")
-            if isinstance(permissions, str):
-                permissions = [permissions] * len(server_ids)
-            elif isinstance(permissions, int):
-                permissions = str(permissions)
-            elif not isinstance(permissions, (str, list)):
-                raise TypeError(f"'permissions' must either be of type str or a list of str instead was of type "
-                                f"{type(permissions).__name__}")
-            elif len(permissions) != len(server_ids):
-                raise ValueError(
-                    '''If 'server_ids' and 'permissions' are both provided as lists, they must have the same length.
-                        Otherwise permissions can be a single string if the role should have the same permissions for
-                        all servers.''')
-
-        url = f'{APIRoutes.ROLES_URL}/{role_id}'
-        data = {}
-        if name is not None:
-            data['name'] = name
-        if server_ids is not None:
-            data['servers'] = []
-            for i in range(len(server_ids)):
-                server_dict = {'id': server_ids[i], 'permissions': permissions[i]}
-                data['servers'].append(server_dict)
-
-        return self._make_request('PATCH', url, data=data)
+        response = self._make_request(*self._prepare_modify_role(role_id, name, server_ids, permissions))
+        self._invalidate_cache('roles', 'users')
+        return response
 
     # Server Functions
 
+    @cached('servers')
     def get_all_servers(self):
         """
         Retrieves a list of all servers.
@@ -327,7 +714,7 @@ class CraftyWeb:
         :raises AccessDenied: If the user does not have the necessary permissions to retrieve server information.
         """
 
-        return self._make_request('GET', APIRoutes.SERVERS_URL)['data']
+        return self._make_request('GET', SERVERS_URL, unwrap='data')
 
     # Create a Server
     # TODO: Fix this Mess
@@ -362,7 +749,7 @@ class CraftyWeb:
     #             'existing_server_path': path,
     #             'command': command
     #         }
-    #     return self._make_request('POST', APIRoutes.SERVERS_URL, data=data)
+    #     return self._make_request('POST', SERVERS_URL, data=data)
 
     # DO NOT USE THIS, IT DOESN'T WORK YET!!!
     # DO NOT USE THIS, IT DOESN'T WORK YET!!!
@@ -413,6 +800,7 @@ class CraftyWeb:
             # TODO: Check that required custom variables exist
             pass
 
+    @cached('servers')
     def get_server(self, server_id):
         """
         Retrieves information about the server corresponding to the specified server ID.
@@ -424,12 +812,23 @@ class CraftyWeb:
         :raises AccessDenied: If the user does not have permission to access the specified server.
         """
 
-        if not isinstance(server_id, (int, str)):
-            raise TypeError(f'Expected "server_id" to be of type int or str, but got {type(server_id).__name__} '
-                            f'instead')
+        self._ensure_id(server_id, 'server_id')
 
-        url = f'{APIRoutes.SERVERS_URL}/{server_id}'
-        return self._make_request('GET', url)['data']
+        url = SERVER_URL % server_id
+        return self._make_request('GET', url, unwrap='data')
+
+    def get_servers_bulk(self, server_ids):
+        """
+        Retrieves information about several servers at once, fetching them concurrently.
+
+        :param server_ids: The IDs of the servers to retrieve information for.
+        :type server_ids: list[int | str]
+        :return: A list of dictionaries containing information about each server, in the same order as `server_ids`.
+        :rtype: list[dict]
+        :raises AccessDenied: If the user does not have permission to access one of the servers.
+        """
+
+        return self._fetch_bulk(self.get_server, server_ids)
 
     def delete_server(self, server_id):
         """
@@ -443,14 +842,13 @@ class CraftyWeb:
         :raises AccessDenied: If the user does not have the necessary permissions to delete the server.
         """
 
-        if not isinstance(server_id, (int, str)):
-            raise TypeError(f'Expected "server_id" to be of type int or str, but got {type(server_id).__name__} '
-                            f'instead')
+        self._ensure_id(server_id, 'server_id')
 
-        url = f'{APIRoutes.SERVERS_URL}/{server_id}'
+        url = SERVER_URL % server_id
         response = self._make_request('DELETE', url)
+        self._invalidate_cache('servers', 'roles')
         if response['status'] == 'ok':
-            print(f'Successfully Removed Server with server ID: {server_id}')
+            _log.info('Successfully Removed Server with server ID: %s', server_id)
         return response
 
     # TODO: Check types
@@ -505,85 +903,12 @@ class CraftyWeb:
         :raises AccessDenied: If the user does not have the necessary permissions to modify the server.
         """
 
-        if not isinstance(server_id, (int, str)):
-            raise TypeError(f'Expected "server_id" to be of type int or str, but got {type(server_id).__name__} '
-                            f'instead')
-        if server_name is not None and not isinstance(server_name, str):
-            raise TypeError(f'Expected "server_name" to be of type str or None, but got {type(server_name).__name__} '
-                            f'instead')
-        if path is not None and not isinstance(path, str):
-            raise TypeError(f'Expected "path" to be of type str or None, but got {type(path).__name__} instead')
-        if backup_path is not None and not isinstance(backup_path, str):
-            raise TypeError(f'Expected "backup_path" to be of type str or None, but got {type(backup_path).__name__} '
-                            f'instead')
-        if executable is not None and not isinstance(executable, str):
-            raise TypeError(f'Expected "executable" to be of type str or None, but got {type(executable).__name__} '
-                            f'instead')
-        if log_path is not None and not isinstance(log_path, str):
-            raise TypeError(f'Expected "log_path" to be of type str or None, but got {type(log_path).__name__} instead')
-        if execution_command is not None and not isinstance(execution_command, str):
-            raise TypeError(f'Expected "execution_command" to be of type str or None, but got '
-                            f'{type(execution_command).__name__} instead')
-        if java_selection is not None and not isinstance(java_selection, str):
-            raise TypeError(f'Expected "java_selection" to be of type str or None, but got '
-                            f'{type(java_selection).__name__} instead')
-        if auto_start is not None and not isinstance(auto_start, bool):
-            raise TypeError(f'Expected "auto_start" to be of type bool or None, but got {type(auto_start).__name__} '
-                            f'instead')
-        if auto_start_delay is not None and not isinstance(auto_start_delay, int):
-            raise TypeError(f'Expected "auto_start_delay" to be of type int or None, but got '
-                            f'{type(auto_start_delay).__name__} instead')
-        if crash_detection is not None and not isinstance(crash_detection, bool):
-            raise TypeError(f'Expected "crash_detection" to be of type bool or None, but got '
-                            f'{type(crash_detection).__name__} instead')
-        if stop_command is not None and not isinstance(stop_command, str):
-            raise TypeError(f'Expected "stop_command" to be of type str or None, but got {type(stop_command).__name__} '
-                            f'instead')
-        if executable_update_url is not None and not isinstance(executable_update_url, str):
-            raise TypeError(f'Expected "executable_update_url" to be of type str or None, but got '
-                            f'{type(executable_update_url).__name__} instead')
-        if server_ip is not None and not isinstance(server_ip, str):
-            raise TypeError(f'Expected "server_ip" to be of type str or None, but got {type(server_ip).__name__} '
-                            f'instead')
-        if server_port is not None and not isinstance(server_port, int):
-            raise TypeError(f'Expected "server_port" to be of type int or None, but got {type(server_port).__name__} '
-                            f'instead')
-        if logs_delete_after is not None and not isinstance(logs_delete_after, int):
-            raise TypeError(f'Expected "logs_delete_after" to be of type int or None, but got '
-                            f'{type(logs_delete_after).__name__} instead')
-        if ignored_exits is not None and not isinstance(ignored_exits, str):
-            raise TypeError(f'Expected "ignored_exits" to be of type int or None, but got '
-                            f'{type(ignored_exits).__name__} instead')
-        if show_status is not None and not isinstance(show_status, bool):
-            raise TypeError(f'Expected "show_status" to be of type bool or None, but got {type(show_status).__name__} '
-                            f'instead')
-        if shutdown_timeout is not None and not isinstance(shutdown_timeout, int):
-            raise TypeError(f'Expected "shutdown_timeout" to be of type int or None, but got '
-                            f'{type(shutdown_timeout).__name__} instead')
-
-        url = f"{APIRoutes.SERVERS_URL}/{server_id}"
-        data = {
-            "server_name": server_name,
-            "path": path,
-            "backup_path": backup_path,
-            "executable": executable,
-            "log_path": log_path,
-            "execution_command": execution_command,
-            "java_selection": java_selection,
-            "auto_start": auto_start,
-            "auto_start_delay": auto_start_delay,
-            "crash_detection": crash_detection,
-            "stop_command": stop_command,
-            "executable_update_url": executable_update_url,
-            "server_ip": server_ip,
-            "server_port": server_port,
-            "logs_delete_after": logs_delete_after,
-            "ignored_exits": ignored_exits,
-            "show_status": show_status,
-            "shutdown_timeout": shutdown_timeout
-        }
-        data = {key: value for key, value in data.items() if value is not None}
-        return self._make_request('PATCH', url, data=data)
+        values = (server_name, path, backup_path, executable, log_path, execution_command, java_selection, auto_start,
+                  auto_start_delay, crash_detection, stop_command, executable_update_url, server_ip, server_port,
+                  logs_delete_after, ignored_exits, show_status, shutdown_timeout)
+        response = self._make_request(*self._prepare_modify_server(server_id, values))
+        self._invalidate_cache('servers')
+        return response
 
     def send_server_action(self, server_id, action):
         """
@@ -600,16 +925,7 @@ class CraftyWeb:
         stop_server, restart_server, kill_server, backup_server, update_executable.
         """
 
-        valid_actions = ['clone_server', 'start_server', 'stop_server', 'restart_server', 'kill_server',
-                         'backup_server', 'update_executable']
-        if action not in valid_actions:
-            raise ValueError(f'Invalid action "{action}". Valid actions are: {", ".join(valid_actions)}')
-        if not isinstance(server_id, (int, str)):
-            raise TypeError(f'Expected "server_id" to be of type int or str, but got {type(server_id).__name__} '
-                            f'instead')
-
-        url = f'{APIRoutes.SERVERS_URL}/{server_id}/action/{action}'
-        return self._make_request('POST', url)
+        return self._make_request(*self._prepare_server_action(server_id, action))
 
     def send_console_command(self, server_id, command):
         """
@@ -624,11 +940,9 @@ class CraftyWeb:
         :raises TypeError: If the given server ID is not of type int or str.
         """
 
-        if not isinstance(server_id, (int, str)):
-            raise TypeError(f'Expected "server_id" to be of type int or str, but got {type(server_id).__name__} '
-                            f'instead')
+        self._ensure_id(server_id, 'server_id')
 
-        url = f'{APIRoutes.SERVERS_URL}/{server_id}/stdin'
+        url = SERVER_STDIN_URL % server_id
         return self._make_request('POST', url, not_json=command)
 
     def get_server_logs(self, server_id, file=False, colors=False, raw=False, html=False):
@@ -650,18 +964,8 @@ class CraftyWeb:
         :raises AccessDenied: If the user does not have permission to access server logs.
         """
 
-        if not isinstance(server_id, (int, str)):
-            raise TypeError(f'Expected "server_id" to be of type int or str, but got {type(server_id).__name__} '
-                            f'instead')
-
-        logs_url = f'{APIRoutes.SERVERS_URL}/{server_id}/logs'
-
-        # Modifies the url to include the optional parameters
-        params = {k: v for k, v in [('file', file), ('colors', colors), ('raw', raw), ('html', html)] if v}
-        url_params = '&'.join([f'{key}={value}' for key, value in params.items()])
-        url = f"{logs_url}?{url_params}" if params else logs_url
-
-        return self._make_request('GET', url)['data']
+        request = self._prepare_server_logs(server_id, file, colors, raw, html)
+        return self._make_request(*request, stream=True, unwrap='data')
 
     def get_server_public_data(self, server_id):
         """
@@ -674,12 +978,10 @@ class CraftyWeb:
         :rtype: dict
         """
 
-        if not isinstance(server_id, (int, str)):
-            raise TypeError(f'Expected "server_id" to be of type int or str, but got {type(server_id).__name__} '
-                            f'instead')
+        self._ensure_id(server_id, 'server_id')
 
-        url = f'{APIRoutes.SERVERS_URL}/{server_id}/public'
-        return self._make_request('GET', url)['data']
+        url = SERVER_PUBLIC_URL % server_id
+        return self._make_request('GET', url, unwrap='data')
 
     def get_server_stats(self, server_id):
         """
@@ -691,12 +993,10 @@ class CraftyWeb:
         :rtype: dict
         """
 
-        if not isinstance(server_id, (int, str)):
-            raise TypeError(f'Expected "server_id" to be of type int or str, but got {type(server_id).__name__} '
-                            f'instead')
+        self._ensure_id(server_id, 'server_id')
 
-        url = f'{APIRoutes.SERVERS_URL}/{server_id}/stats'
-        return self._make_request('GET', url)['data']
+        url = SERVER_STATS_URL % server_id
+        return self._make_request('GET', url, unwrap='data')
 
     # TODO: Test to see if this works
     def get_server_users(self, server_id):
@@ -709,20 +1009,15 @@ class CraftyWeb:
         :rtype: dict
         """
 
-        if not isinstance(server_id, (int, str)):
-            raise TypeError(f'Expected "server_id" to be of type int or str, but got {type(server_id).__name__} '
-                            f'instead')
+        self._ensure_id(server_id, 'server_id')
 
-        url = f'{APIRoutes.SERVERS_URL}/{server_id}/users'
-        users = self._make_request('GET', url)['data']
+        url = SERVER_USERS_URL % server_id
+        users = self._make_request('GET', url, unwrap='data')
 
-        user_dict = {}
-        for user in users:
-            with self._silence_response():
-                user_data = self.get_user(user)
-            user_dict[user_data['user_id']] = user_data['username']
+        def get_user_quietly(user_id):
+            return self._make_request('GET', USER_URL % user_id, unwrap='data', log_response=False)
 
-        return user_dict
+        return self._usernames(self._fetch_bulk(get_user_quietly, users))
 
     # TODO: Complete this one and the next one
     def create_schedule(self, server_id, data):
@@ -738,11 +1033,9 @@ class CraftyWeb:
         :raises AccessDenied: If the user does not have permission to create a scheduled task for the server.
         """
 
-        if not isinstance(server_id, (int, str)):
-            raise TypeError(f'Expected "server_id" to be of type int or str, but got {type(server_id).__name__} '
-                            f'instead')
+        self._ensure_id(server_id, 'server_id')
 
-        url = f'{APIRoutes.SERVERS_URL}/{server_id}/tasks'
+        url = SERVER_TASKS_URL % server_id
         return self._make_request('POST', url, data=data)
 
     def modify_schedule(self, server_id, task_id, data):
@@ -760,11 +1053,10 @@ class CraftyWeb:
         :raises AccessDenied: If the user does not have permission to modify the task schedule.
         """
 
-        for arg, arg_name in [(server_id, 'server_id'), (task_id, 'task_id')]:
-            if not isinstance(arg, (int, str)):
-                raise TypeError(f'Expected "{arg_name}" to be of type int or str, but got {type(arg).__name__} instead')
+        self._ensure_id(server_id, 'server_id')
+        self._ensure_id(task_id, 'task_id')
 
-        url = f'{APIRoutes.SERVERS_URL}/{server_id}/tasks/{task_id}'
+        url = SERVER_TASK_URL % (server_id, task_id)
         return self._make_request('PATCH', url, data=data)
 
     def remove_schedule(self, server_id, task_id):
@@ -779,18 +1071,18 @@ class CraftyWeb:
         :rtype: dict
         """
 
-        for arg, arg_name in [(server_id, 'server_id'), (task_id, 'task_id')]:
-            if not isinstance(arg, (int, str)):
-                raise TypeError(f'Expected "{arg_name}" to be of type int or str, but got {type(arg).__name__} instead')
+        self._ensure_id(server_id, 'server_id')
+        self._ensure_id(task_id, 'task_id')
 
-        url = f'{APIRoutes.SERVERS_URL}/{server_id}/tasks/{task_id}'
+        url = SERVER_TASK_URL % (server_id, task_id)
         response = self._make_request('DELETE', url)
         if response['status'] == 'ok':
-            print(f'Successfully Removed Schedule with task ID: {task_id}')
+            _log.info('Successfully Removed Schedule with task ID: %s', task_id)
         return response
 
     # User Functions
 
+    @cached('users')
     def get_all_users(self):
         """
         Retrieves a list of all users in the system.
@@ -799,7 +1091,7 @@ class CraftyWeb:
         :rtype: list
         """
 
-        return self._make_request('GET', APIRoutes.USERS_URL)['data']
+        return self._make_request('GET', USERS_URL, unwrap='data')
 
     # TODO: Complete this (Mostly Done) (Check for types)
     def create_user(self, username, password, email=None, enabled=True, hints=True, lang='en_US', roles=None,
@@ -825,34 +1117,20 @@ class CraftyWeb:
         :type superuser: bool
         :return: A dictionary containing the newly created user's id number (user_id).
         :rtype: dict
-        :raises: ValueError if 'roles' contains an invalid role.
+        :raises: ValueError if 'roles' contains an invalid role (only checked when `validate_roles` is enabled).
         """
 
-        if roles is not None:
-            with self._silence_response():
-                roles_list = self.get_all_roles()
-            valid_roles = [str(role['role_id']) for role in roles_list or []]
-
-            roles = [str(role) for role in roles or []]
-            invalid_roles = [role for role in roles if role not in valid_roles]
-            if invalid_roles:
-                raise ValueError(f"Invalid role(s): {', '.join(invalid_roles)}. Valid role(s): "
-                                 f"{', '.join(valid_roles)}.")
+        request = self._prepare_create_user(username, password, email, enabled, hints, lang, roles, superuser)
 
-        data = {
-            'username': username,
-            'password': password,
-            'email': email,
-            'enabled': enabled,
-            'hints': hints,
-            'lang': lang,
-            'roles': roles,
-            'superuser': superuser,
-        }
+        # The server rejects unknown roles itself, checking them here costs an extra request unless it is cached
+        if request.data.get('roles') and self.validate_roles:
+            self._check_roles(request.data['roles'], self._get_valid_role_ids())
 
-        data = {key: value for key, value in data.items() if value is not None}
-        return self._make_request('POST', APIRoutes.USERS_URL, data=data)
+        response = self._make_request(*request)
+        self._invalidate_cache('users', 'roles')
+        return response
 
+    @cached('users')
     def get_user(self, user_id):
         """
         Retrieves the user corresponding to the specified user ID.
@@ -863,11 +1141,22 @@ class CraftyWeb:
         :rtype: dict
         """
 
-        if not isinstance(user_id, (int, str)):
-            raise TypeError(f'Expected "user_id" to be of type int or str, but got {type(user_id).__name__} instead')
+        self._ensure_id(user_id, 'user_id')
+
+        url = USER_URL % user_id
+        return self._make_request('GET', url, unwrap='data')
+
+    def get_users_bulk(self, user_ids):
+        """
+        Retrieves several users at once, fetching them concurrently.
+
+        :param user_ids: The IDs of the users to retrieve.
+        :type user_ids: list[int | str]
+        :return: A list of dictionaries containing the details of each user, in the same order as `user_ids`.
+        :rtype: list[dict]
+        """
 
-        url = f'{APIRoutes.USERS_URL}/{user_id}'
-        return self._make_request('GET', url)['data']
+        return self._fetch_bulk(self.get_user, user_ids)
 
     def delete_user(self, user_id):
         """
@@ -879,13 +1168,13 @@ class CraftyWeb:
         :rtype: dict
         """
 
-        if not isinstance(user_id, (int, str)):
-            raise TypeError(f'Expected "user_id" to be of type int or str, but got {type(user_id).__name__} instead')
+        self._ensure_id(user_id, 'user_id')
 
-        url = f'{APIRoutes.USERS_URL}/{user_id}'
+        url = USER_URL % user_id
         response = self._make_request('DELETE', url)
+        self._invalidate_cache('users', 'roles')
         if response['status'] == 'ok':
-            print(f'Successfully Removed User with user ID: {user_id}')
+            _log.info('Successfully Removed User with user ID: %s', user_id)
         return response
 
     def modify_user(self, user_id, username=None, password=None, email=None, enabled=None, superuser=None, lang=None,
@@ -922,70 +1211,21 @@ class CraftyWeb:
         :raises AccessDenied: If the user does not have the necessary permissions to modify the user.
         """
 
-        if not isinstance(user_id, (int, str)):
-            raise TypeError(f'Expected "user_id" to be of type int or str, but got {type(user_id).__name__} instead')
-        if username is not None and not isinstance(username, str):
-            raise TypeError(f"Expected 'username' to be of type str, but got {type(username).__name__} instead")
-        if password is not None and not isinstance(password, str):
-            raise TypeError(f"Expected 'password' to be of type str, but got {type(password).__name__} instead")
-        if email is not None and not isinstance(email, str):
-            raise TypeError(f"Expected 'email' to be of type str, but got {type(email).__name__} instead")
-        if enabled is not None and not isinstance(enabled, bool):
-            raise TypeError(f"Expected 'enabled' to be of type bool, but got {type(enabled).__name__} instead")
-        if superuser is not None and not isinstance(superuser, bool):
-            raise TypeError(f"Expected 'superuser' to be of type bool, but got {type(superuser).__name__} instead")
-        if lang is not None and not isinstance(lang, str):
-            raise TypeError(f"Expected 'lang' to be of type str, but got {type(lang).__name__} instead")
-        if hints is not None and not isinstance(hints, bool):
-            raise TypeError(f"Expected 'hints' to be of type bool, but got {type(hints).__name__} instead")
-        if roles is not None:
-            if isinstance(roles, (int, str)):
-                roles = [roles]
-            if not isinstance(roles, (int, str, list)):
-                raise TypeError(f"Expected 'roles' to be of type list[int], but got {type(roles).__name__} instead")
-            roles = [str(role) for role in roles]
-        if permissions is not None:
-            if not isinstance(permissions, dict):
-                raise TypeError(f"Expected 'permissions' to be of type dict, but got {type(permissions).__name__} "
-                                f"instead")
-            if 'enabled' not in permissions or 'name' not in permissions or 'quantity' not in permissions:
-                raise ValueError("permissions dictionary must contain 'enabled', 'name', and 'quantity' keys")
-            if not isinstance(permissions["enabled"], bool):
-                raise TypeError("The 'enabled' key in the permissions dictionary must be a boolean.")
-            if not isinstance(permissions["name"], str):
-                raise TypeError("The 'name' key in the permissions dictionary must be a string.")
-            if not isinstance(permissions["quantity"], int):
-                raise TypeError("The 'quantity' key in the permissions dictionary must be an integer.")
+        request = self._prepare_modify_user(user_id, username, password, email, enabled, superuser, lang, hints, roles,
+                                            permissions)
 
         # Check to see if the user already has any of the passed roles, if so remove them from the new roles
-        if not remove_roles and roles:
-            with self._silence_response():
-                prev_roles = self.get_user(user_id)['roles']
-            new_roles = []
-            for role in roles:
-                if str(role) not in [str(prev_role['role_id']) for prev_role in prev_roles]:
-                    new_roles.append(str(role))
-                else:
-                    print(f'User {user_id} already has role {role}. If you intend on removing it, set parameter '
-                          f'"remove_roles" to True.')
-            roles = new_roles if new_roles else None
-
-        data = {
-            'username': username,
-            'password': password,
-            'email': email,
-            'enabled': enabled,
-            'superuser': superuser,
-            'lang': lang,
-            'hints': hints,
-            'roles': roles,
-            'permissions': permissions,
-        }
-        data = {key: value for key, value in data.items() if value is not None}
+        if not remove_roles and request.data.get('roles'):
+            # Bypass the cache, a stale entry would silently drop roles that were removed since it was stored
+            prev_user = self._make_request('GET', USER_URL % user_id, unwrap='data', log_response=False)
+            self._drop_existing_roles(request, user_id, prev_user)
 
-        url = f'{APIRoutes.USERS_URL}/{user_id}'
-        return self._make_request('PATCH', url, data=data)
+        response = self._make_request(*request)
+        self._invalidate_cache('users', 'roles')
+        return response
 
+    @cached('users')
+    @_user_getter(USER_PERMISSIONS_URL)
     def get_user_crafty_permissions(self, user_id):
         """
         Get the Crafty permissions for the user corresponding to the specified user ID.
@@ -996,12 +1236,7 @@ class CraftyWeb:
         :rtype: dict
         """
 
-        if not isinstance(user_id, (int, str)):
-            raise TypeError(f'Expected "user_id" to be of type int or str, but got {type(user_id).__name__} instead')
-
-        url = f'{APIRoutes.USERS_URL}/{user_id}/permissions'
-        return self._make_request('GET', url)['data']
-
+    @_user_getter(USER_PFP_URL)
     def get_user_profile_picture(self, user_id):
         """
         Retrieve the profile picture for the user corresponding to the specified user ID.
@@ -1012,12 +1247,8 @@ class CraftyWeb:
         :rtype: str
         """
 
-        if not isinstance(user_id, (int, str)):
-            raise TypeError(f'Expected "user_id" to be of type int or str, but got {type(user_id).__name__} instead')
-
-        url = f'{APIRoutes.USERS_URL}/{user_id}/pfp'
-        return self._make_request('GET', url)['data']
-
+    @cached('users')
+    @_user_getter(USER_PUBLIC_URL)
     def get_user_public_data(self, user_id):
         """
         Retrieve the public data for the user corresponding to the specified user ID.
@@ -1028,14 +1259,43 @@ class CraftyWeb:
         :rtype: dict
         """
 
-        url = f'{APIRoutes.USERS_URL}/{user_id}/public'
-        return self._make_request('GET', url)['data']
+    def get_users_crafty_permissions(self, user_ids):
+        """
+        Get the Crafty permissions for several users at once, fetching them concurrently.
+
+        :param user_ids: The IDs of the users to retrieve permissions for.
+        :type user_ids: list[int | str]
+        :return: A list of dictionaries containing each user's Crafty permissions, in the same order as `user_ids`.
+        :rtype: list[dict]
+        """
+
+        return self._fetch_bulk(self.get_user_crafty_permissions, user_ids)
+
+    def get_users_profile_pictures(self, user_ids):
+        """
+        Retrieve the profile pictures for several users at once, fetching them concurrently.
+
+        :param user_ids: The IDs of the users to retrieve the profile pictures for.
+        :type user_ids: list[int | str]
+        :return: A list of links to each user's profile picture, in the same order as `user_ids`.
+        :rtype: list[str]
+        """
+
+        return self._fetch_bulk(self.get_user_profile_picture, user_ids)
+
+    def get_users_public_data(self, user_ids):
+        """
+        Retrieve the public data for several users at once, fetching them concurrently.
+
+        :param user_ids: The IDs of the users to retrieve the public data for.
+        :type user_ids: list[int | str]
+        :return: A list of dictionaries containing each user's public data, in the same order as `user_ids`.
+        :rtype: list[dict]
+        """
 
-    # Test Functions
+        return self._fetch_bulk(self.get_user_public_data, user_ids)
 
-    # Designed for testing purposes
-    def test_foo(self, method, url, data=None):
-        return self._make_request(method, url, data=data)
+    # JSON Schema Functions
 
     def get_json_schemas(self):
         """
@@ -1043,8 +1303,8 @@ class CraftyWeb:
         :return: A list containing all valid JSON schemas
         :rtype: list
         """
-        url = f'{APIRoutes.SCHEMA_URL}'
-        return self._make_request('GET', url)['data']
+        url = SCHEMA_URL
+        return self._make_request('GET', url, unwrap='data')
 
     # TODO: Add in default schema values with 'https://json-schema-faker.js.org/'
     def json_schema(self, schema):
@@ -1061,16 +1321,7 @@ class CraftyWeb:
         :raises TypeError: If the input 'schema' is not a string.
         """
 
-        with self._silence_response():
-            valid_schemas = self.get_json_schemas()
-
-        if not isinstance(schema, str):
-            raise TypeError(f"Expected `schema` to be a string, but got {type(schema).__name__}")
-        if schema not in valid_schemas:
-            raise ValueError(f"Invalid schema. Must be one of the following: {valid_schemas}")
+        if not self._schema_is_known(schema):
+            self._check_schema(schema, self._make_request('GET', SCHEMA_URL, unwrap='data', log_response=False))
 
-        url = f'{APIRoutes.SCHEMA_URL}/{schema}'
-        response = self._make_request('GET', url)
-        if response['status'] == 'ok':
-            print(json.dumps(response['data'], indent=4))
-        return response
+        return self._print_schema(self._make_request('GET', SCHEMA_NAME_URL % schema))
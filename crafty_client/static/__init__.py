@@ -1,2 +1,4 @@
+from crafty_client.static import cache
 from crafty_client.static import exceptions
+from crafty_client.static import json_utils
 from crafty_client.static import routes
@@ -0,0 +1,131 @@
+import functools
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+
+_MISSING = object()
+
+
+class TTLCache(object):
+
+    def __init__(self, maxsize=256):
+        """ A thread-safe LRU cache whose entries also expire after a per-entry time to live"""
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        # Futures of the values currently being fetched, keyed like the entries
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _lookup(self, key, default):
+        # Must be called with the lock held
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            return default
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def claim(self, key):
+        """
+        Looks up `key` and coalesces concurrent misses for it.
+
+        Returns `(value, None, False)` on a hit. On a miss the first caller gets `(None, future, True)` and must settle
+        the future with `resolve` or `fail`, callers missing the same key in the meantime get `(None, future, False)`
+        and can wait on the result instead of fetching it again.
+        """
+        with self._lock:
+            value = self._lookup(key, _MISSING)
+            if value is not _MISSING:
+                self.hits += 1
+                return value, None, False
+            future = self._pending.get(key)
+            if future is not None:
+                self.hits += 1
+                return None, future, False
+            self.misses += 1
+            future = self._pending[key] = Future()
+            return None, future, True
+
+    def resolve(self, key, future, value, ttl):
+        """ Stores the value fetched for a claimed `key` and hands it to everyone waiting on `future`"""
+        with self._lock:
+            # Only store the value if the key wasn't invalidated while it was being fetched
+            if self._pending.get(key) is future:
+                del self._pending[key]
+                self._store(key, value, ttl)
+        future.set_result(value)
+
+    def fail(self, key, future, exception):
+        """ Releases a claimed `key` whose fetch raised, everyone waiting on `future` gets the same exception"""
+        with self._lock:
+            if self._pending.get(key) is future:
+                del self._pending[key]
+        future.set_exception(exception)
+
+    def _store(self, key, value, ttl):
+        # Must be called with the lock held
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, tag):
+        """ Drops every entry stored under `tag` (the first element of each key)"""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == tag]:
+                del self._entries[key]
+            # Fetches already in flight may have read the old state, don't let them store it
+            for key in [key for key in self._pending if key[0] == tag]:
+                del self._pending[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._pending.clear()
+
+
+def cached(tag):
+    """
+    Caches the result of a `CraftyWeb` getter under `tag` when the client was created with `cache=True`.
+
+    The time to live is looked up in the client's `cache_ttl` dictionary using `tag`, a value of 0 disables caching
+    for that tag.
+
+    Identical calls made while the first one is still waiting for its response don't send their own request, they
+    wait for and return the first call's result.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            ttl = self.cache_ttl.get(tag, 0)
+            if self._cache is None or not ttl:
+                return func(self, *args, **kwargs)
+
+            cache = self._cache
+            key = (tag, func.__name__, args, tuple(sorted(kwargs.items())))
+            value, future, owner = cache.claim(key)
+            if future is None:
+                return value
+            if not owner:
+                # The same call is already in flight on another thread, share its response instead of repeating it
+                return future.result()
+
+            try:
+                value = func(self, *args, **kwargs)
+            except BaseException as e:
+                cache.fail(key, future, e)
+                raise
+            cache.resolve(key, future, value, ttl)
+            return value
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,26 @@
+import json
+
+# Match orjson's output: compact separators and raw UTF-8 instead of \u escapes keep request bodies small
+_encoder = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+
+
+def _stdlib_dumps(obj):
+    return _encoder.encode(obj).encode('utf-8')
+
+
+# orjson is an optional speedup (pip install crafty_client[fastjson]), fall back to the standard library without it
+try:
+    import orjson
+except ImportError:
+    loads = json.loads
+    dumps = _stdlib_dumps
+else:
+    loads = orjson.loads
+
+    def dumps(obj):
+        # Accept everything the standard library does: non-str dict keys are converted like json.dumps converts
+        # them, and anything else orjson refuses (e.g. integers wider than 64 bits) is left to the standard library
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            return _stdlib_dumps(obj)
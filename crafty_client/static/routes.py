@@ -1,8 +1,61 @@
+from typing import Final
+
+BASE_URL: Final = '/api/v2'
+ROLES_URL: Final = f'{BASE_URL}/roles'
+SERVERS_URL: Final = f'{BASE_URL}/servers'
+USERS_URL: Final = f'{BASE_URL}/users'
+AUTH_URL: Final = f'{BASE_URL}/auth'
+LOGIN_URL: Final = f'{AUTH_URL}/login'
+INVALIDATE_TOKENS_URL: Final = f'{AUTH_URL}/invalidate_tokens'
+SCHEMA_URL: Final = f'{BASE_URL}/jsonschema'
+
+# Templates for routes containing IDs, fill them in with the % operator
+ROLE_URL: Final = ROLES_URL + '/%s'
+ROLE_SERVERS_URL: Final = ROLES_URL + '/%s/servers'
+ROLE_USERS_URL: Final = ROLES_URL + '/%s/users'
+SERVER_URL: Final = SERVERS_URL + '/%s'
+SERVER_ACTION_URL: Final = SERVERS_URL + '/%s/action/%s'
+SERVER_STDIN_URL: Final = SERVERS_URL + '/%s/stdin'
+SERVER_LOGS_URL: Final = SERVERS_URL + '/%s/logs'
+SERVER_PUBLIC_URL: Final = SERVERS_URL + '/%s/public'
+SERVER_STATS_URL: Final = SERVERS_URL + '/%s/stats'
+SERVER_USERS_URL: Final = SERVERS_URL + '/%s/users'
+SERVER_TASKS_URL: Final = SERVERS_URL + '/%s/tasks'
+SERVER_TASK_URL: Final = SERVERS_URL + '/%s/tasks/%s'
+USER_URL: Final = USERS_URL + '/%s'
+USER_PERMISSIONS_URL: Final = USERS_URL + '/%s/permissions'
+USER_PFP_URL: Final = USERS_URL + '/%s/pfp'
+USER_PUBLIC_URL: Final = USERS_URL + '/%s/public'
+SCHEMA_NAME_URL: Final = SCHEMA_URL + '/%s'
+
+
 class APIRoutes(object):
-    BASE_URL = '/api/v2'
-    ROLES_URL = f'{BASE_URL}/roles'
-    SERVERS_URL = f'{BASE_URL}/servers'
-    USERS_URL = f'{BASE_URL}/users'
-    AUTH_URL = f'{BASE_URL}/auth'
-    LOGIN_URL = f'{AUTH_URL}/login'
-    SCHEMA_URL = f'{BASE_URL}/jsonschema'
+    # Kept for code that still uses the class as a namespace, the clients import the module constants directly
+    __slots__ = ()
+
+    BASE_URL = BASE_URL
+    ROLES_URL = ROLES_URL
+    SERVERS_URL = SERVERS_URL
+    USERS_URL = USERS_URL
+    AUTH_URL = AUTH_URL
+    LOGIN_URL = LOGIN_URL
+    INVALIDATE_TOKENS_URL = INVALIDATE_TOKENS_URL
+    SCHEMA_URL = SCHEMA_URL
+
+    ROLE_URL = ROLE_URL
+    ROLE_SERVERS_URL = ROLE_SERVERS_URL
+    ROLE_USERS_URL = ROLE_USERS_URL
+    SERVER_URL = SERVER_URL
+    SERVER_ACTION_URL = SERVER_ACTION_URL
+    SERVER_STDIN_URL = SERVER_STDIN_URL
+    SERVER_LOGS_URL = SERVER_LOGS_URL
+    SERVER_PUBLIC_URL = SERVER_PUBLIC_URL
+    SERVER_STATS_URL = SERVER_STATS_URL
+    SERVER_USERS_URL = SERVER_USERS_URL
+    SERVER_TASKS_URL = SERVER_TASKS_URL
+    SERVER_TASK_URL = SERVER_TASK_URL
+    USER_URL = USER_URL
+    USER_PERMISSIONS_URL = USER_PERMISSIONS_URL
+    USER_PFP_URL = USER_PFP_URL
+    USER_PUBLIC_URL = USER_PUBLIC_URL
+    SCHEMA_NAME_URL = SCHEMA_NAME_URL